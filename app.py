@@ -1,6 +1,9 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import json
+import os
+from pathlib import Path
 from typing import List, Dict
 from pydantic import BaseModel
 
@@ -20,40 +23,120 @@ class Probabilities(BaseModel):
     players: List[PlayerProbabilities]
     cut_distributions: Dict[str, List[CutDistributionEntry]]
 
-# Load JSON data
-with open("probabilities.json") as f:
-    data = Probabilities.model_validate_json(f.read())
+PROBABILITIES_FILE = os.environ.get("TFT_PROBABILITIES", "probabilities.json")
+PERCENT_COLUMNS = ["Top 16 %", "Top 8 %", "Win %"]
+
+# Load JSON data (cached per file version so reruns skip the parse). The
+# validated model is only read, so keep it as a shared resource instead of
+# pickling/unpickling it on every cache hit like st.cache_data would.
+@st.cache_resource(show_spinner=False, max_entries=4)
+def load_probability_data(filename: str, mtime: float) -> Probabilities:
+    # model_validate_json parses the raw bytes in pydantic-core directly,
+    # so there is no separate json/orjson pass or text decode
+    return Probabilities.model_validate_json(Path(filename).read_bytes())
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def create_player_dataframe(filename: str, mtime: float) -> pd.DataFrame:
+    data = load_probability_data(filename, mtime)
+    players = data.players
+    df = pd.DataFrame({
+        "Name": [p.name for p in players],
+        "Points": [p.current_points for p in players],
+        "Avg Placement": [p.average_placement for p in players],
+    })
+    # Percentage block as a (players x PERCENT_COLUMNS) matrix, scaled at once
+    pct = np.array(
+        [
+            (
+                p.cut_probabilities.get("top16", 0),
+                p.cut_probabilities.get("top8", 0),
+                p.prob_to_win,
+            )
+            for p in players
+        ],
+        dtype=np.float64,
+    ).reshape(-1, len(PERCENT_COLUMNS))
+    # Rounded so the raw values (CSV download, copy) carry no float noise
+    df[PERCENT_COLUMNS] = np.round(pct * 100, 2)
+    return df
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def get_cut_charts_data(filename: str, mtime: float) -> Dict[str, pd.DataFrame]:
+    data = load_probability_data(filename, mtime)
+    charts = {}
+    for stage, dist in data.cut_distributions.items():
+        # Indexed by points up front so the chart can use the frame as-is
+        charts[stage] = pd.DataFrame(
+            {"probability": np.fromiter((d.probability for d in dist), dtype=np.float64, count=len(dist))},
+            index=pd.Index(
+                np.fromiter((d.points for d in dist), dtype=np.float64, count=len(dist)),
+                name="points",
+            ),
+        )
+    return charts
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def get_cut_summaries(filename: str, mtime: float) -> Dict[str, str]:
+    summaries = {}
+    for stage, df_cut in get_cut_charts_data(filename, mtime).items():
+        heading = f"### {stage.upper()} Cut"
+        if df_cut.empty:
+            summaries[stage] = f"{heading}\n\nNo cut data available."
+            continue
+        points = df_cut.index.to_numpy()
+        probs = df_cut["probability"].to_numpy()
+        i = probs.argmax()
+        summaries[stage] = (f"{heading}\n\nMost likely cut: **{points[i]} pts** "
+                            f"({probs[i] * 100:.1f}%)")
+    return summaries
+
+@st.cache_resource(show_spinner=False)
+def get_player_column_config():
+    return {
+        col: st.column_config.NumberColumn(col, format="%.1f%%")
+        for col in PERCENT_COLUMNS
+    }
+
+# Stat and read in one guarded step; st.cache_* never caches the exception,
+# so an unreadable file is retried on the next rerun
+try:
+    probabilities_mtime = os.path.getmtime(PROBABILITIES_FILE)
+    load_probability_data(PROBABILITIES_FILE, probabilities_mtime)
+except OSError as e:
+    st.error(f"Could not read {PROBABILITIES_FILE}: {e}")
+    st.stop()
+
+@st.fragment
+def render_player_info():
+    st.subheader("Player Probabilities Table")
+    df = create_player_dataframe(PROBABILITIES_FILE, probabilities_mtime)
+    st.dataframe(
+        df,
+        use_container_width=True,
+        column_config=get_player_column_config(),
+    )
+
+@st.fragment
+def render_cut_info():
+    st.subheader("Cut Point Distributions")
+
+    cut_charts = get_cut_charts_data(PROBABILITIES_FILE, probabilities_mtime)
+    cut_summaries = get_cut_summaries(PROBABILITIES_FILE, probabilities_mtime)
+    for stage, df_cut in cut_charts.items():
+        st.markdown(cut_summaries[stage])
+        if not df_cut.empty:
+            st.bar_chart(df_cut)
 
 # Tabs
 tab1, tab2, tab3 = st.tabs(["📋 Player Info", "🎯 Cut Info", "🧪 TBD"])
 
 # Tab 1: Player Table
 with tab1:
-    st.subheader("Player Probabilities Table")
-    table_data = []
-    for p in data.players:
-        table_data.append({
-            "Name": p.name,
-            "Points": p.current_points,
-            "Avg Placement": p.average_placement,
-            "Top 16 %": round(p.cut_probabilities.get("top16", 0) * 100, 2),
-            "Top 8 %": round(p.cut_probabilities.get("top8", 0) * 100, 2),
-            "Win %": round(p.prob_to_win * 100, 2),
-        })
-    df = pd.DataFrame(table_data)
-    st.dataframe(df, use_container_width=True)
+    render_player_info()
 
 # Tab 2: Cut Info Charts
 with tab2:
-    st.subheader("Cut Point Distributions")
-
-    for stage, dist in data.cut_distributions.items():
-        st.markdown(f"### {stage.upper()} Cut")
-        df_cut = pd.DataFrame([d.model_dump() for d in dist])
-        most_likely = df_cut.loc[df_cut["probability"].idxmax()]
-        st.write(f"Most likely cut: **{most_likely['points']} pts** "
-                 f"({most_likely['probability'] * 100:.1f}%)")
-        st.bar_chart(df_cut.set_index("points"))
+    render_cut_info()
 
 # Tab 3: Placeholder
 with tab3: